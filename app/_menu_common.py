@@ -0,0 +1,133 @@
+"""Front-end independent helpers shared by the interactive menu.
+
+Kept free of Textual and of module-level engine/media imports, so the menu
+entry point and tests can import it cheaply.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from functools import cache, lru_cache
+from pathlib import Path
+import platform
+from types import ModuleType
+from typing import NamedTuple
+
+from .config import AppConfig, get_config_path, load_config
+
+
+class TranscribeRequest(NamedTuple):
+    """Input data required to run a transcription (immutable, handed to a worker thread)."""
+
+    input_path: Path
+    output_dir: Path
+    model: str
+    device: str
+
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# (config file mtime, parsed config); the mtime is None when the file is missing.
+_CONFIG_CACHE: tuple[int | None, AppConfig] | None = None
+
+
+def _run_transcription(request: TranscribeRequest) -> Path:
+    """Run the transcription pipeline and return the output path."""
+
+    from engine import create_engine
+    from media.audio import prepared_audio
+    from output.text import open_text_output
+
+    engine_config = replace(
+        _safe_load_config().engine,
+        model=request.model,
+        device=request.device,
+    )
+    # Engines are cheap; the loaded model behind them is cached by the engine module.
+    engine = create_engine(engine_config)
+    output_path = request.output_dir / f"{request.input_path.stem}.txt"
+    with prepared_audio(request.input_path) as audio, open_text_output(output_path) as out:
+        engine.transcribe(audio, out, language=None)
+    return output_path
+
+
+def _format_bytes(value: float) -> str:
+    """Format bytes in a human-readable form."""
+
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit directly.
+    size = int(value)
+    index = min((size.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1) if size > 0 else 0
+    return f"{value / (1 << (index * 10)):.1f} {_BYTE_UNITS[index]}"
+
+
+@lru_cache(maxsize=8)
+def _format_total(value: int) -> str:
+    """Format a RAM/disk total; these repeat on every status tick, so they are memoized."""
+
+    return _format_bytes(value)
+
+
+def _ffmpeg_path() -> str | None:
+    """Return the FFmpeg location used for transcription, or None if it is missing.
+
+    Goes through `media.audio.find_ffmpeg`, so the status line and the pipeline
+    share one cache (reset with `media.audio.invalidate_ffmpeg_cache`).
+    """
+
+    from media.audio import FfmpegNotFoundError, find_ffmpeg
+
+    try:
+        return find_ffmpeg()
+    except FfmpegNotFoundError:
+        return None
+
+
+@cache
+def _get_psutil() -> ModuleType | None:
+    """Return the psutil module with its CPU sampler primed, or None if unavailable.
+
+    The first `cpu_percent(interval=None)` call always reports 0.0; priming it here,
+    once per process, makes every later reading meaningful.
+    """
+
+    try:
+        import psutil  # type: ignore
+    except ModuleNotFoundError:
+        return None
+    psutil.cpu_percent(interval=None)
+    return psutil
+
+
+@cache
+def _python_version() -> str:
+    """Return the running Python version."""
+
+    return platform.python_version()
+
+
+def _safe_load_config() -> AppConfig:
+    """Load config with fallback to defaults, reusing it while the file is unchanged."""
+
+    global _CONFIG_CACHE
+
+    try:
+        mtime: int | None = get_config_path().stat().st_mtime_ns
+    except OSError:
+        mtime = None
+
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == mtime:
+        return _CONFIG_CACHE[1]
+
+    try:
+        config = load_config()
+    except ValueError:
+        config = AppConfig()
+    _CONFIG_CACHE = (mtime, config)
+    return config
+
+
+def _clear_config_cache() -> None:
+    """Drop the cached config so the next load re-reads the file."""
+
+    global _CONFIG_CACHE
+    _CONFIG_CACHE = None
@@ -2,141 +2,196 @@
 
 from __future__ import annotations
 
+import argparse
+from dataclasses import replace
+from functools import cache
+import importlib.util
 import logging
+import os
 from pathlib import Path
-from typing import Optional
+import sys
+from typing import Optional, Sequence
 
-import typer
-
-from .config import EngineConfig, get_config_path, load_config
+from .config import get_config_path, load_config
 from .logging import configure_logging
-from engine import create_engine
-from media.audio import MediaError, prepared_audio
-from output.text import write_text_file
 
 
-def create_cli_app() -> typer.Typer:
-    """Create the Typer CLI app (kept as a factory to avoid global state)."""
+@cache
+def create_cli_app() -> argparse.ArgumentParser:
+    """Create the CLI argument parser (built once, on first use).
+
+    The parser is built on stdlib argparse so that `--help`, argument errors and
+    the menu/test commands never import a third-party CLI framework.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="transcriber",
+        description="Offline MP3/MP4 transcription to TXT using faster-whisper.",
+    )
+    # Launch the menu when no subcommand is provided.
+    parser.set_defaults(handler=_launch_menu)
+    commands = parser.add_subparsers(title="commands", metavar="COMMAND")
+
+    menu = commands.add_parser(
+        "menu",
+        help="Launch the interactive menu.",
+        description="Launch the interactive menu.",
+    )
+    menu.set_defaults(handler=_launch_menu)
+
+    test = commands.add_parser(
+        "test",
+        help="Run the test suite.",
+        description="Run the test suite.",
+    )
+    test.set_defaults(handler=_test)
+
+    run = commands.add_parser(
+        "run",
+        help="Transcribe a single MP3/MP4 file to a plain-text .txt file.",
+        description="Transcribe a single MP3/MP4 file to a plain-text .txt file.",
+    )
+    run.add_argument(
+        "input_file",
+        type=_existing_file,
+        metavar="INPUT_FILE",
+        help="Path to an .mp3 or .mp4 file.",
+    )
+    run.add_argument(
+        "-o",
+        "--out",
+        type=_directory,
+        default=None,
+        metavar="DIR",
+        help="Output directory for the .txt transcript (defaults to input file directory).",
+    )
+    run.add_argument(
+        "--model",
+        default=None,
+        help="Whisper model size or local model path (default: small).",
+    )
+    run.add_argument(
+        "--device",
+        default=None,
+        help="Inference device (overrides config; default: cpu).",
+    )
+    run.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable debug logging.",
+    )
+    run.set_defaults(handler=_run)
+
+    return parser
+
+
+def run_cli(argv: Optional[Sequence[str]] = None) -> int:
+    """Parse arguments, dispatch to the selected command and return its exit code."""
+
+    args = create_cli_app().parse_args(argv)
+    return args.handler(args)
+
+
+def _launch_menu(args: argparse.Namespace) -> int:
+    """Launch the interactive menu."""
+
+    if importlib.util.find_spec("textual") is None:
+        _err("Missing dependency: textual. Install with `pip install -e .`.")
+        return 2
+
+    from .menu import run_menu
+
+    run_menu()
+    return 0
+
+
+def _test(args: argparse.Namespace) -> int:
+    """Run the test suite."""
+
+    from .testing import run_tests
+
+    try:
+        code, _ = run_tests(on_line=print)
+    except ModuleNotFoundError as exc:
+        _err(str(exc))
+        return 2
+
+    return code
+
+
+def _run(args: argparse.Namespace) -> int:
+    """Transcribe a single MP3/MP4 file to a plain-text .txt file."""
+
+    configure_logging(verbose=args.verbose)
+    logger = logging.getLogger("transcriber")
+    input_file: Path = args.input_file
+
+    try:
+        config = load_config()
+    except ValueError as exc:
+        _err(f"Config error: {exc}")
+        _err(f"Config path: {get_config_path()}")
+        return 2
+
+    # Deferred so `--help` and argument errors never pay for the engine/media stack.
+    from engine import create_engine
+    from media.audio import MediaError, prepared_audio
+    from output.text import open_text_output
 
-    app = typer.Typer(
-        add_completion=False,
-        help="Offline MP3/MP4 transcription to TXT using faster-whisper.",
-        no_args_is_help=False,
+    engine_config = replace(
+        config.engine,
+        model=args.model or config.engine.model,
+        device=args.device or config.engine.device,
     )
 
-    def _launch_menu() -> None:
-        try:
-            from .menu import run_menu
-        except ModuleNotFoundError as exc:
-            typer.secho(
-                "Missing dependency: textual. Install with `pip install -e .`.",
-                fg=typer.colors.RED,
-                err=True,
-            )
-            raise typer.Exit(code=2) from exc
-
-        run_menu()
-
-    @app.callback(invoke_without_command=True)
-    def _main(ctx: typer.Context) -> None:
-        """Launch menu when no subcommand is provided."""
-
-        if ctx.invoked_subcommand is None:
-            _launch_menu()
-
-    @app.command("menu")
-    def menu() -> None:
-        """Launch the interactive menu."""
-
-        _launch_menu()
-
-    @app.command("test")
-    def test() -> None:
-        """Run the test suite."""
-
-        from .testing import run_tests
-
-        try:
-            code, output = run_tests()
-        except ModuleNotFoundError as exc:
-            typer.secho(str(exc), fg=typer.colors.RED, err=True)
-            raise typer.Exit(code=2) from exc
-
-        if output:
-            typer.echo(output.rstrip())
-        if code != 0:
-            raise typer.Exit(code=code)
-
-    @app.command("run")
-    def run(
-        input_file: Path = typer.Argument(
-            ...,
-            exists=True,
-            readable=True,
-            dir_okay=False,
-            help="Path to an .mp3 or .mp4 file.",
-        ),
-        out: Optional[Path] = typer.Option(
-            None,
-            "--out",
-            "-o",
-            file_okay=False,
-            dir_okay=True,
-            help="Output directory for the .txt transcript (defaults to input file directory).",
-        ),
-        model: Optional[str] = typer.Option(
-            None,
-            "--model",
-            help="Whisper model size or local model path (default: small).",
-        ),
-        device: Optional[str] = typer.Option(
-            None,
-            "--device",
-            help="Inference device (overrides config; default: cpu).",
-        ),
-        verbose: bool = typer.Option(
-            False,
-            "--verbose",
-            help="Enable debug logging.",
-        ),
-    ) -> None:
-        """Transcribe a single MP3/MP4 file to a plain-text .txt file."""
-
-        configure_logging(verbose=verbose)
-        logger = logging.getLogger("transcriber")
-
-        try:
-            config = load_config()
-        except ValueError as exc:
-            typer.secho(f"Config error: {exc}", fg=typer.colors.RED, err=True)
-            typer.secho(f"Config path: {get_config_path()}", fg=typer.colors.RED, err=True)
-            raise typer.Exit(code=2) from exc
-
-        engine_config = EngineConfig(
-            backend=config.engine.backend,
-            model=model or config.engine.model,
-            device=device or config.engine.device,
-        )
-
-        output_dir = out or input_file.parent
-        output_path = output_dir / f"{input_file.stem}.txt"
-
-        try:
-            engine = create_engine(engine_config)
-            with prepared_audio(input_file) as audio_path:
-                logger.info("Transcribing: %s", input_file.name)
-                text = engine.transcribe(audio_path, language=None)
-            write_text_file(output_path, text)
-        except MediaError as exc:
-            typer.secho(f"Media error: {exc}", fg=typer.colors.RED, err=True)
-            raise typer.Exit(code=2) from exc
-        except ModuleNotFoundError as exc:
-            typer.secho(str(exc), fg=typer.colors.RED, err=True)
-            raise typer.Exit(code=2) from exc
-        except Exception as exc:  # noqa: BLE001 - intentional CLI boundary
-            typer.secho(f"Error: {exc}", fg=typer.colors.RED, err=True)
-            raise typer.Exit(code=1) from exc
-
-        typer.echo(str(output_path))
-
-    return app
+    output_dir = args.out or input_file.parent
+    output_path = output_dir / f"{input_file.stem}.txt"
+
+    try:
+        engine = create_engine(engine_config)
+        with prepared_audio(input_file) as audio, open_text_output(output_path) as out:
+            logger.info("Transcribing: %s", input_file.name)
+            engine.transcribe(audio, out, language=None)
+    except MediaError as exc:
+        _err(f"Media error: {exc}")
+        return 2
+    except ModuleNotFoundError as exc:
+        _err(str(exc))
+        return 2
+    except Exception as exc:  # noqa: BLE001 - intentional CLI boundary
+        _err(f"Error: {exc}")
+        return 1
+
+    print(output_path)
+    return 0
+
+
+def _existing_file(value: str) -> Path:
+    """argparse type: a readable file that exists."""
+
+    path = Path(value)
+    if not path.exists():
+        raise argparse.ArgumentTypeError(f"file {value!r} does not exist.")
+    if path.is_dir():
+        raise argparse.ArgumentTypeError(f"file {value!r} is a directory.")
+    if not os.access(path, os.R_OK):
+        raise argparse.ArgumentTypeError(f"file {value!r} is not readable.")
+    return path
+
+
+def _directory(value: str) -> Path:
+    """argparse type: a directory path (it may not exist yet)."""
+
+    path = Path(value)
+    if path.exists() and not path.is_dir():
+        raise argparse.ArgumentTypeError(f"directory {value!r} is a file.")
+    return path
+
+
+def _err(message: str) -> None:
+    """Print an error message to stderr, in red when stderr is an ANSI terminal."""
+
+    # Legacy Windows consoles need colorama for ANSI codes; print plain text there.
+    if os.name != "nt" and sys.stderr.isatty():
+        message = f"\x1b[31m{message}\x1b[0m"
+    print(message, file=sys.stderr)
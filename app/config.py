@@ -8,16 +8,38 @@ Transcriber loads an optional TOML file from OS-specific locations:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import cache
 import os
 from pathlib import Path
-import platform
 from typing import Any
 
-try:  # Python 3.11+
-    import tomllib  # type: ignore
-except ModuleNotFoundError:  # Python 3.10
-    import tomli as tomllib  # type: ignore
+
+_TOML_TEMPLATE = """\
+[engine]
+model = {model}
+device = {device}
+compute_type = {compute_type}
+cpu_threads = {cpu_threads}
+num_workers = {num_workers}
+
+[output]
+extension = "txt"
+"""
+
+# Output extensions accepted in [output]; only plain text is supported.
+_ALLOWED_OUTPUT_EXTS: frozenset[str] = frozenset({"txt"})
+
+_TOML_ESCAPES = {
+    **{code: f"\\u{code:04X}" for code in (*range(0x20), 0x7F)},
+    ord("\b"): "\\b",
+    ord("\t"): "\\t",
+    ord("\n"): "\\n",
+    ord("\f"): "\\f",
+    ord("\r"): "\\r",
+    ord('"'): '\\"',
+    ord("\\"): "\\\\",
+}
 
 
 @dataclass(frozen=True, slots=True)
@@ -27,6 +49,12 @@ class EngineConfig:
     backend: str = "faster-whisper"
     model: str = "small"
     device: str = "cpu"
+    # "auto" picks a quantization per device (int8 on CPU, int8_float16 on CUDA).
+    compute_type: str = "auto"
+    # 0 uses every available CPU core.
+    cpu_threads: int = 0
+    # Parallel decoders; only helps when several transcriptions run concurrently.
+    num_workers: int = 1
 
 
 @dataclass(frozen=True, slots=True)
@@ -36,27 +64,43 @@ class OutputConfig:
     extension: str = "txt"
 
 
+# Frozen configs are immutable, so a single default instance can be shared.
+_DEFAULT_ENGINE = EngineConfig()
+_DEFAULT_OUTPUT = OutputConfig()
+
+
 @dataclass(frozen=True, slots=True)
 class AppConfig:
     """Top-level application configuration."""
 
-    engine: EngineConfig = field(default_factory=EngineConfig)
-    output: OutputConfig = field(default_factory=OutputConfig)
+    engine: EngineConfig = _DEFAULT_ENGINE
+    output: OutputConfig = _DEFAULT_OUTPUT
 
 
+_DEFAULT_APP = AppConfig()
+
+
+@cache
 def get_config_path() -> Path:
-    """Return the default configuration file path for the current OS."""
+    """Return the default configuration file path for the current OS.
+
+    The result is computed once per process; call `get_config_path.cache_clear()`
+    if the environment changes.
+    """
+
+    import platform
 
     system = platform.system().lower()
     if system == "windows":
         appdata = os.environ.get("APPDATA")
+        # Joined as strings so only the final Path is constructed.
         if appdata:
-            return Path(appdata) / "transcriber" / "config.toml"
+            return Path(os.path.join(appdata, "transcriber", "config.toml"))
 
         # Reasonable fallback for unusual environments.
-        return Path.home() / "AppData" / "Roaming" / "transcriber" / "config.toml"
+        return Path(os.path.join(Path.home(), "AppData", "Roaming", "transcriber", "config.toml"))
 
-    return Path.home() / ".config" / "transcriber" / "config.toml"
+    return Path(os.path.join(Path.home(), ".config", "transcriber", "config.toml"))
 
 
 def load_config(path: Path | None = None) -> AppConfig:
@@ -70,23 +114,36 @@ def load_config(path: Path | None = None) -> AppConfig:
     """
 
     config_path = path or get_config_path()
-    if not config_path.exists():
-        return AppConfig()
+    # Opening directly (rather than checking exists() first) costs one syscall
+    # instead of two when the file is present.
+    try:
+        f = config_path.open("rb")
+    except (FileNotFoundError, NotADirectoryError):
+        return _DEFAULT_APP
+
+    with f:
+        # Imported here so the common "no config file" path never loads a TOML parser.
+        try:  # Python 3.11+
+            import tomllib  # type: ignore
+        except ModuleNotFoundError:  # Python 3.10
+            import tomli as tomllib  # type: ignore
 
-    with config_path.open("rb") as f:
         raw = tomllib.load(f)
 
     engine_raw = _get_table(raw, "engine")
     output_raw = _get_table(raw, "output")
 
     engine = EngineConfig(
-        backend=_get_str(engine_raw, "backend", default=EngineConfig.backend),
-        model=_get_str(engine_raw, "model", default=EngineConfig.model),
-        device=_get_str(engine_raw, "device", default=EngineConfig.device),
+        backend=_get_str(engine_raw, "backend", default=_DEFAULT_ENGINE.backend),
+        model=_get_str(engine_raw, "model", default=_DEFAULT_ENGINE.model),
+        device=_get_str(engine_raw, "device", default=_DEFAULT_ENGINE.device),
+        compute_type=_get_str(engine_raw, "compute_type", default=_DEFAULT_ENGINE.compute_type),
+        cpu_threads=_get_int(engine_raw, "cpu_threads", default=_DEFAULT_ENGINE.cpu_threads, minimum=0),
+        num_workers=_get_int(engine_raw, "num_workers", default=_DEFAULT_ENGINE.num_workers, minimum=1),
     )
 
-    extension = _get_str(output_raw, "extension", default=OutputConfig.extension)
-    if extension.lower() != "txt":
+    extension = _get_str(output_raw, "extension", default=_DEFAULT_OUTPUT.extension)
+    if extension.lower() not in _ALLOWED_OUTPUT_EXTS:
         raise ValueError("Only plain text output is supported: set [output].extension = 'txt'.")
 
     output = OutputConfig(extension="txt")
@@ -107,13 +164,20 @@ def save_config(config: AppConfig, path: Path | None = None) -> Path:
         ValueError: If unsupported values are provided.
     """
 
-    if config.output.extension.lower() != "txt":
+    if config.output.extension.lower() not in _ALLOWED_OUTPUT_EXTS:
         raise ValueError("Only plain text output is supported: set [output].extension = 'txt'.")
 
     config_path = path or get_config_path()
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-
     content = _to_toml(config)
+
+    # Skip the write when the file already holds exactly this content.
+    try:
+        if config_path.read_text(encoding="utf-8") == content:
+            return config_path
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+
+    config_path.parent.mkdir(parents=True, exist_ok=True)
     config_path.write_text(content, encoding="utf-8")
     return config_path
 
@@ -140,14 +204,32 @@ def _get_str(raw: dict[str, Any], key: str, default: str) -> str:
     raise ValueError(f"Invalid config: {key} must be a non-empty string.")
 
 
+def _get_int(raw: dict[str, Any], key: str, default: int, minimum: int) -> int:
+    """Internal helper to get a TOML integer (at least `minimum`) with a default."""
+
+    value = raw.get(key)
+    if value is None:
+        return default
+    if isinstance(value, int) and not isinstance(value, bool) and value >= minimum:
+        return value
+    raise ValueError(f"Invalid config: {key} must be an integer >= {minimum}.")
+
+
+def _toml_string(value: str) -> str:
+    """Internal helper to render a TOML basic string (escapes quotes, backslashes)."""
+
+    return f'"{value.translate(_TOML_ESCAPES)}"'
+
+
 def _to_toml(config: AppConfig) -> str:
     """Serialize config data to TOML."""
 
-    return (
-        "[engine]\n"
-        f'model = "{config.engine.model}"\n'
-        f'device = "{config.engine.device}"\n'
-        "\n"
-        "[output]\n"
-        'extension = "txt"\n'
+    return _TOML_TEMPLATE.format_map(
+        {
+            "model": _toml_string(config.engine.model),
+            "device": _toml_string(config.engine.device),
+            "compute_type": _toml_string(config.engine.compute_type),
+            "cpu_threads": config.engine.cpu_threads,
+            "num_workers": config.engine.num_workers,
+        }
     )
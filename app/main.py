@@ -6,10 +6,9 @@ from __future__ import annotations
 def main() -> None:
     """Run the Transcriber CLI."""
 
-    from .cli import create_cli_app
+    from .cli import run_cli
 
-    app = create_cli_app()
-    app()
+    raise SystemExit(run_cli())
 
 
 if __name__ == "__main__":
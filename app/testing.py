@@ -5,12 +5,17 @@ from __future__ import annotations
 import importlib.util
 import subprocess
 import sys
-from typing import Tuple
+from typing import Callable, Optional, Tuple
 
 
-def run_tests() -> Tuple[int, str]:
+def run_tests(on_line: Optional[Callable[[str], None]] = None) -> Tuple[int, str]:
     """Run the test suite and return (exit_code, output).
 
+    Args:
+        on_line: Optional callback receiving each output line (without its newline)
+            as pytest prints it. When given, lines are streamed to it instead of
+            being collected, and the returned output is empty.
+
     Raises:
         ModuleNotFoundError: If pytest is not installed.
     """
@@ -20,10 +25,18 @@ def run_tests() -> Tuple[int, str]:
             'pytest is not installed. Install dev deps with: pip install -e ".[dev]"'
         )
 
-    result = subprocess.run(
-        [sys.executable, "-m", "pytest"],
-        capture_output=True,
+    collected: list[str] = []
+    emit = on_line or collected.append
+    # stderr is merged into stdout so output arrives in the order pytest wrote it.
+    with subprocess.Popen(
+        [sys.executable, "-m", "pytest", "--color=no"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
         text=True,
-    )
-    output = (result.stdout or "") + (result.stderr or "")
-    return result.returncode, output
+        bufsize=1,
+    ) as process:
+        assert process.stdout is not None
+        for line in process.stdout:
+            emit(line.rstrip("\n"))
+
+    return process.returncode, "\n".join(collected)
@@ -0,0 +1,590 @@
+"""Modern TUI menu for Transcriber (Textual)."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable
+
+from rich.text import Text
+from textual import work
+from textual.app import App, ComposeResult
+from textual.containers import Container, Horizontal, Vertical
+from textual.message import Message
+from textual.reactive import reactive
+from textual.timer import Timer
+from textual.widgets import Button, Footer, Header, Input, Label, ListItem, ListView, RichLog, Static
+from textual.worker import get_current_worker
+
+from .config import AppConfig, OutputConfig, get_config_path, save_config
+from ._menu_common import (
+    TranscribeRequest,
+    _clear_config_cache,
+    _ffmpeg_path,
+    _format_bytes,
+    _format_total,
+    _get_psutil,
+    _python_version,
+    _run_transcription,
+    _safe_load_config,
+)
+from .testing import run_tests
+
+
+_ERROR_STYLE = "#ef4444"
+_SUCCESS_STYLE = "#22c55e"
+
+# Status sampling cadence; disk usage rarely changes, so it is sampled less often.
+_STATS_INTERVAL_SECONDS = 1.0
+_DISK_INTERVAL_SECONDS = 5.0
+
+# Longest delay before streamed test output is shown.
+_FLUSH_INTERVAL_SECONDS = 0.1
+
+# Repeated Save clicks closer together than this are ignored.
+_SAVE_DEBOUNCE_SECONDS = 0.2
+
+# One Static per status line, so a tick only re-renders the lines that changed.
+_STAT_LINES = ("cpu", "ram", "disk", "python", "ffmpeg")
+# Content views, each mounted as `#view-<name>` and selected by the sidebar item `#<name>`.
+_VIEW_NAMES = ("transcribe", "settings", "status", "tests")
+
+# Form fields of the transcribe view, by widget id.
+_TRANSCRIBE_INPUTS = ("input_path", "output_dir", "model", "device")
+
+_CPU_TEMPLATE = "CPU usage: {cpu:.1f}%"
+_RAM_TEMPLATE = "RAM: {used} / {total} ({percent:.1f}%)"
+_DISK_TEMPLATE = "Disk ({root}): {free} free / {total} total"
+
+
+class TranscribeDone(Message):
+    """Posted by the transcription worker when the transcript has been saved."""
+
+    def __init__(self, output_path: Path) -> None:
+        super().__init__()
+        self.output_path = output_path
+
+
+class TranscribeFailed(Message):
+    """Posted by the transcription worker with a user-facing error message."""
+
+    def __init__(self, error: str) -> None:
+        super().__init__()
+        self.error = error
+
+
+class TestsOutput(Message):
+    """Posted by the test worker with a batch of pytest output lines."""
+
+    def __init__(self, text: str) -> None:
+        super().__init__()
+        self.text = text
+
+
+class TestsFinished(Message):
+    """Posted by the test worker with the rendered result."""
+
+    def __init__(self, result: Text) -> None:
+        super().__init__()
+        self.result = result
+
+
+class StatsSampled(Message):
+    """Posted by the status sampler with rendered text per status line."""
+
+    def __init__(self, lines: dict[str, str]) -> None:
+        super().__init__()
+        self.lines = lines
+
+
+class _LineBatcher:
+    """Collects output lines from a worker thread and hands them over in timed batches.
+
+    Posting one message per line would schedule a log re-render per line and
+    crowd out key presses. `add` flushes once `interval` seconds have passed
+    since the last flush; the owner also calls `flush` on a timer, so lines
+    that arrive just before a quiet spell are not held back. Safe to use from
+    several threads.
+    """
+
+    def __init__(self, flush: Callable[[str], None], interval: float = _FLUSH_INTERVAL_SECONDS) -> None:
+        self._flush = flush
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._lines: list[str] = []
+        self._flushed_at = time.monotonic()
+
+    def add(self, line: str) -> None:
+        with self._lock:
+            self._lines.append(line)
+            due = time.monotonic() - self._flushed_at >= self._interval
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        # The callback runs under the lock so batches are handed over in order.
+        with self._lock:
+            if self._lines:
+                self._flush("\n".join(self._lines))
+                self._lines.clear()
+            self._flushed_at = time.monotonic()
+
+
+class MenuApp(App[None]):
+    """Top-level Textual app for the Transcriber menu."""
+
+    CSS = """
+    Screen {
+        background: #0b0f19;
+        color: #e6e6e6;
+    }
+
+    Header, Footer {
+        background: #111827;
+    }
+
+    #layout {
+        height: 1fr;
+    }
+
+    #sidebar {
+        width: 24;
+        background: #0f172a;
+        border: tall #1f2937;
+        padding: 1 1;
+    }
+
+    #content {
+        background: #0b0f19;
+        border: tall #1f2937;
+        padding: 1 2;
+    }
+
+    ListView {
+        background: #0f172a;
+        border: none;
+    }
+
+    ListItem.--highlight {
+        background: #1f2937;
+    }
+
+    .title {
+        text-style: bold;
+        color: #93c5fd;
+        margin-bottom: 1;
+    }
+
+    Input {
+        background: #0b1220;
+        border: round #1f2937;
+    }
+
+    Button {
+        background: #111827;
+        border: round #374151;
+    }
+
+    Button.-primary {
+        background: #2563eb;
+        border: round #1d4ed8;
+        color: #ffffff;
+    }
+    """
+
+    BINDINGS = [("q", "quit", "Quit")]
+
+    current_view = reactive("transcribe")
+
+    def compose(self) -> ComposeResult:
+        yield Header(show_clock=True)
+        with Horizontal(id="layout"):
+            with Vertical(id="sidebar"):
+                yield Label("Menu", classes="title")
+                yield ListView(
+                    ListItem(Label("Transcribe"), id="transcribe"),
+                    ListItem(Label("Settings"), id="settings"),
+                    ListItem(Label("System Status"), id="status"),
+                    ListItem(Label("Run Tests"), id="tests"),
+                    ListItem(Label("Exit"), id="exit"),
+                    id="menu",
+                )
+            with Container(id="content"):
+                yield TranscribeView(id="view-transcribe")
+                yield SettingsView(id="view-settings")
+                yield StatusView(id="view-status")
+                yield TestsView(id="view-tests")
+        yield Footer()
+
+    def on_mount(self) -> None:
+        # Views are resolved once; switching views then never walks the DOM.
+        self._views = {name: self.query_one(f"#view-{name}") for name in _VIEW_NAMES}
+        self._show_view("transcribe")
+        self.query_one("#menu", ListView).index = 0
+
+    def on_list_view_selected(self, event: ListView.Selected) -> None:
+        target_id = event.item.id
+        if target_id == "exit":
+            self.exit()
+            return
+        if target_id in self._views:
+            self._show_view(target_id)
+
+    def _show_view(self, name: str) -> None:
+        self.current_view = name
+        for view_name, view in self._views.items():
+            view.display = view_name == name
+
+
+class MenuView(Static):
+    """Base class for the content views; carries the styles they share."""
+
+    DEFAULT_CSS = """
+    MenuView .section {
+        border: round #1f2937;
+        padding: 1 2;
+        margin-bottom: 1;
+    }
+
+    MenuView #message {
+        color: #f59e0b;
+        margin-top: 1;
+    }
+    """
+
+    def _set_message(self, text: str, error: bool = False) -> None:
+        # Errors are styled inline rather than via a CSS class, so updates from
+        # workers never trigger a stylesheet recompute.
+        self.query_one("#message", Static).update(Text(text, style=_ERROR_STYLE if error else ""))
+
+
+class TranscribeView(MenuView):
+    """Transcription form view."""
+
+    def compose(self) -> ComposeResult:
+        yield Label("Transcribe a file", classes="title")
+        with Vertical(classes="section"):
+            yield Label("Input file (.mp3 or .mp4)")
+            yield Input(placeholder="C:\\path\\to\\audio.mp3", id="input_path")
+            yield Label("Output directory (optional)")
+            yield Input(placeholder="Leave blank to use input folder", id="output_dir")
+        with Vertical(classes="section"):
+            yield Label("Model (optional)")
+            yield Input(placeholder="Defaults to config", id="model")
+            yield Label("Device (optional)")
+            yield Input(placeholder="Defaults to config", id="device")
+        with Horizontal(classes="section"):
+            yield Button("Run", id="run", classes="-primary")
+            yield Button("Clear", id="clear")
+        yield Static("", id="message")
+
+    def on_mount(self) -> None:
+        self._inputs = {input_id: self.query_one(f"#{input_id}", Input) for input_id in _TRANSCRIBE_INPUTS}
+
+    def on_show(self) -> None:
+        config = _safe_load_config()
+        message = self.query_one("#message", Static)
+        message.update(f"Defaults: model={config.engine.model}, device={config.engine.device}")
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "clear":
+            self._clear_inputs()
+            return
+        if event.button.id == "run":
+            self._start_transcription()
+
+    def _clear_inputs(self) -> None:
+        for field in self._inputs.values():
+            field.value = ""
+
+    def _start_transcription(self) -> None:
+        # Deferred with the rest of the pipeline so opening the menu never loads media code.
+        from media.audio import is_supported_media
+
+        config = _safe_load_config()
+        input_value = self._inputs["input_path"].value.strip()
+        if not input_value:
+            self._set_message("Enter an input file path.", error=True)
+            return
+
+        input_path = Path(input_value).expanduser()
+        if not input_path.exists():
+            self._set_message(f"Input file does not exist: {input_path}", error=True)
+            return
+        if not is_supported_media(input_path):
+            self._set_message("Unsupported file type. Use .mp3 or .mp4.", error=True)
+            return
+
+        output_value = self._inputs["output_dir"].value.strip()
+        output_dir = Path(output_value).expanduser() if output_value else input_path.parent
+        model_value = self._inputs["model"].value.strip() or config.engine.model
+        device_value = self._inputs["device"].value.strip() or config.engine.device
+
+        request = TranscribeRequest(
+            input_path=input_path,
+            output_dir=output_dir,
+            model=model_value,
+            device=device_value,
+        )
+
+        self._set_message("Transcribing... This may take a while.")
+        self.query_one("#run", Button).disabled = True
+        self._transcribe_thread(request)
+
+    @work(thread=True, exclusive=True, group="transcribe")
+    def _transcribe_thread(self, request: TranscribeRequest) -> None:
+        from media.audio import MediaError
+
+        try:
+            output_path = _run_transcription(request)
+        except MediaError as exc:
+            self.post_message(TranscribeFailed(f"Media error: {exc}"))
+        except ModuleNotFoundError as exc:
+            self.post_message(TranscribeFailed(str(exc)))
+        except Exception as exc:  # noqa: BLE001 - UI boundary
+            self.post_message(TranscribeFailed(f"Error: {exc}"))
+        else:
+            self.post_message(TranscribeDone(output_path))
+
+    def on_transcribe_done(self, message: TranscribeDone) -> None:
+        self._set_message(f"Saved transcript: {message.output_path}")
+        self._enable_run()
+
+    def on_transcribe_failed(self, message: TranscribeFailed) -> None:
+        self._set_message(message.error, error=True)
+        self._enable_run()
+
+    def _enable_run(self) -> None:
+        self.query_one("#run", Button).disabled = False
+
+
+class SettingsView(MenuView):
+    """Settings view for configuration updates."""
+
+    _last_save = float("-inf")
+
+    def compose(self) -> ComposeResult:
+        yield Label("Settings", classes="title")
+        with Vertical(classes="section"):
+            yield Static("", id="config_path")
+            yield Label("Model")
+            yield Input(id="model")
+            yield Label("Device")
+            yield Input(id="device")
+        with Horizontal(classes="section"):
+            yield Button("Save", id="save", classes="-primary")
+            yield Button("Reset to defaults", id="reset")
+            yield Button("Reload model", id="reload")
+        yield Static("", id="message")
+
+    def on_show(self) -> None:
+        config = _safe_load_config()
+        self.query_one("#config_path", Static).update(f"Config path: {get_config_path()}")
+        self.query_one("#model", Input).value = config.engine.model
+        self.query_one("#device", Input).value = config.engine.device
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "save":
+            self._save()
+        elif event.button.id == "reset":
+            self._reset()
+        elif event.button.id == "reload":
+            self._release_models()
+            self._set_message("Loaded models released; the next run reloads the model.")
+
+    def _save(self) -> None:
+        now = time.monotonic()
+        if now - self._last_save < _SAVE_DEBOUNCE_SECONDS:
+            return
+        self._last_save = now
+
+        config = _safe_load_config()
+        model = self.query_one("#model", Input).value.strip() or config.engine.model
+        device = self.query_one("#device", Input).value.strip() or config.engine.device
+
+        new_config = AppConfig(
+            engine=replace(config.engine, model=model, device=device),
+            output=OutputConfig(extension="txt"),
+        )
+        try:
+            path = save_config(new_config)
+            _clear_config_cache()
+            self._set_message(f"Saved: {path}", error=False)
+        except ValueError as exc:
+            self._set_message(f"Config error: {exc}", error=True)
+
+    def _release_models(self) -> None:
+        from engine import clear_model_cache
+
+        clear_model_cache()
+
+    def _reset(self) -> None:
+        try:
+            path = save_config(AppConfig())
+            _clear_config_cache()
+            self._release_models()
+            self.on_show()
+            self._set_message(f"Reset to defaults: {path}", error=False)
+        except ValueError as exc:
+            self._set_message(f"Config error: {exc}", error=True)
+
+
+class StatusView(MenuView):
+    """Live system status view."""
+
+    def compose(self) -> ComposeResult:
+        yield Label("System status", classes="title")
+        with Vertical(classes="section"):
+            for line in _STAT_LINES:
+                yield Static("", id=f"stat-{line}")
+            yield Button("Refresh", id="refresh")
+
+    def on_mount(self) -> None:
+        # Invariants for the sampling loop are resolved once per mount.
+        cwd = Path.cwd()
+        self._disk_path = str(cwd)
+        self._disk_root = cwd.anchor or self._disk_path
+        self._psutil = _get_psutil()
+
+        self._lines = {line: self.query_one(f"#stat-{line}", Static) for line in _STAT_LINES}
+        self._shown: dict[str, str] = {}
+        self._show({"python": f"Python: {_python_version()}"})
+
+        self._wake = threading.Event()
+        self._sample_stats()
+
+    def on_show(self) -> None:
+        # FFmpeg is probed on first show rather than on mount: every view is
+        # mounted at startup, and the probe loads the media package.
+        if "ffmpeg" not in self._shown:
+            self._show_ffmpeg()
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "refresh":
+            # A manual refresh also re-checks PATH in case FFmpeg was just installed.
+            from media.audio import invalidate_ffmpeg_cache
+
+            invalidate_ffmpeg_cache()
+            self._show_ffmpeg()
+            self._wake.set()
+
+    def on_unmount(self) -> None:
+        # Wake the sampler so it notices cancellation without waiting out its sleep.
+        self.workers.cancel_group(self, "stats")
+        self._wake.set()
+
+    def on_stats_sampled(self, message: StatsSampled) -> None:
+        self._show(message.lines)
+
+    def _show(self, lines: dict[str, str]) -> None:
+        """Update only the status lines whose text changed."""
+
+        for line, text in lines.items():
+            if self._shown.get(line) != text:
+                self._shown[line] = text
+                self._lines[line].update(text)
+
+    def _show_ffmpeg(self) -> None:
+        self._show({"ffmpeg": f"FFmpeg: {'found' if _ffmpeg_path() else 'not found'}"})
+
+    @work(thread=True, exclusive=True, group="stats")
+    def _sample_stats(self) -> None:
+        # Sampling runs on its own thread so psutil's disk_usage (a statvfs call
+        # that can block on slow or network drives) never stalls the UI; the UI
+        # thread only renders the posted text.
+        worker = get_current_worker()
+        if self._psutil is None:
+            self.post_message(
+                StatsSampled({"cpu": "psutil is not installed. Install with `pip install -e .`."})
+            )
+            return
+
+        disk = self._psutil.disk_usage(self._disk_path)
+        disk_sampled_at = time.monotonic()
+        while not worker.is_cancelled:
+            forced = self._wake.is_set()
+            self._wake.clear()
+            now = time.monotonic()
+            if forced or now - disk_sampled_at >= _DISK_INTERVAL_SECONDS:
+                disk = self._psutil.disk_usage(self._disk_path)
+                disk_sampled_at = now
+            self.post_message(StatsSampled(self._snapshot(disk)))
+            self._wake.wait(_STATS_INTERVAL_SECONDS)
+
+    def _snapshot(self, disk: Any) -> dict[str, str]:
+        """Return the CPU, RAM and disk status lines around a disk usage sample."""
+
+        memory = self._psutil.virtual_memory()
+        return {
+            "cpu": _CPU_TEMPLATE.format(cpu=self._psutil.cpu_percent(interval=None)),
+            "ram": _RAM_TEMPLATE.format(
+                used=_format_bytes(memory.used),
+                total=_format_total(memory.total),
+                percent=memory.percent,
+            ),
+            "disk": _DISK_TEMPLATE.format(
+                root=self._disk_root,
+                free=_format_bytes(disk.free),
+                total=_format_total(disk.total),
+            ),
+        }
+
+
+class TestsView(MenuView):
+    """Test runner view."""
+
+    def compose(self) -> ComposeResult:
+        yield Label("Run tests", classes="title")
+        with Vertical(classes="section"):
+            yield Button("Run tests", id="run", classes="-primary")
+            yield RichLog(id="output", highlight=True, markup=False)
+
+    def on_mount(self) -> None:
+        self._flush_timer: Timer | None = None
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "run":
+            self._run_tests()
+
+    def _run_tests(self) -> None:
+        output = self.query_one("#output", RichLog)
+        output.clear()
+        output.write("Running tests...\n")
+        # Thread workers cannot be interrupted, so a second run is blocked until
+        # this one finishes rather than racing it.
+        self.query_one("#run", Button).disabled = True
+        batcher = _LineBatcher(lambda text: self.post_message(TestsOutput(text)))
+        # Output that arrives during a quiet spell still shows within one interval.
+        self._flush_timer = self.set_interval(_FLUSH_INTERVAL_SECONDS, batcher.flush)
+        self._run_tests_thread(batcher)
+
+    @work(thread=True, exclusive=True, group="tests")
+    def _run_tests_thread(self, batcher: _LineBatcher) -> None:
+        try:
+            try:
+                code, _ = run_tests(on_line=batcher.add)
+            finally:
+                # Hand over the tail of the output before the result message.
+                batcher.flush()
+            if code == 0:
+                self.post_message(TestsFinished(Text("Tests passed.", style=_SUCCESS_STYLE)))
+            else:
+                self.post_message(
+                    TestsFinished(Text(f"Tests failed (exit code {code}).", style=_ERROR_STYLE))
+                )
+        except ModuleNotFoundError as exc:
+            self.post_message(TestsFinished(Text(str(exc), style=_ERROR_STYLE)))
+        except Exception as exc:  # noqa: BLE001 - UI boundary
+            self.post_message(TestsFinished(Text(f"Error: {exc}", style=_ERROR_STYLE)))
+
+    def on_tests_output(self, message: TestsOutput) -> None:
+        self.query_one("#output", RichLog).write(message.text)
+
+    def on_tests_finished(self, message: TestsFinished) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        self.query_one("#output", RichLog).write(message.result)
+        self.query_one("#run", Button).disabled = False
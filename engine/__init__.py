@@ -5,7 +5,9 @@ from __future__ import annotations
 from app.config import EngineConfig
 
 from .base import TranscriptionEngine
-from .faster_whisper import FasterWhisperEngine
+from .faster_whisper import FasterWhisperEngine, clear_model_cache
+
+__all__ = ["FasterWhisperEngine", "TranscriptionEngine", "clear_model_cache", "create_engine"]
 
 
 def create_engine(config: EngineConfig) -> TranscriptionEngine:
@@ -16,6 +18,12 @@ def create_engine(config: EngineConfig) -> TranscriptionEngine:
 
     backend = (config.backend or "").strip().lower()
     if backend in {"faster-whisper", "faster_whisper", "whisper"}:
-        return FasterWhisperEngine(model=config.model, device=config.device)
+        return FasterWhisperEngine(
+            model=config.model,
+            device=config.device,
+            compute_type=config.compute_type,
+            cpu_threads=config.cpu_threads,
+            num_workers=config.num_workers,
+        )
     raise ValueError(f"Unsupported engine backend: {config.backend!r}")
 
@@ -2,23 +2,32 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Protocol, TextIO, Union
 
+if TYPE_CHECKING:
+    import numpy as np
 
-class TranscriptionEngine(ABC):
-    """Interface for speech-to-text engines."""
 
-    @abstractmethod
-    def transcribe(self, audio_path: Path, language: Optional[str] = None) -> str:
-        """Transcribe an audio file into plain text.
+class TranscriptionEngine(Protocol):
+    """Interface for speech-to-text engines.
+
+    Engines satisfy it structurally; they do not need to inherit from it.
+    """
+
+    def transcribe(
+        self, audio: Union[Path, np.ndarray], out: TextIO, language: Optional[str] = None
+    ) -> None:
+        """Transcribe an audio file, streaming plain text to `out`.
+
+        Text is written as it is decoded, so the full transcript is never held in
+        memory. The output has no timestamps, is stripped of leading/trailing
+        whitespace and ends with a single newline (nothing is written for silence).
 
         Args:
-            audio_path: Path to an audio file (typically WAV after preprocessing).
+            audio: Path to an audio file, or 16kHz mono float32 samples (as yielded
+                by `media.audio.prepared_audio`).
+            out: Writable text stream receiving the transcript.
             language: Optional language code (e.g. "en"). When None, auto-detect.
-
-        Returns:
-            Transcribed text as a single string (no timestamps).
         """
 
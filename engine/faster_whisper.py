@@ -2,42 +2,96 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional, TextIO, Union
 
-from .base import TranscriptionEngine
+if TYPE_CHECKING:
+    import numpy as np
 
 
-class FasterWhisperEngine(TranscriptionEngine):
+# Quantization used for compute_type="auto": int8 weights on CPU, int8 weights
+# with float16 activations on CUDA.
+_AUTO_COMPUTE_TYPES = {"cpu": "int8", "cuda": "int8_float16", "auto": "int8"}
+
+# Loaded WhisperModel instances shared by all engines in the process, keyed by
+# (model, device, compute_type, cpu_threads, num_workers), so repeated runs skip
+# reloading the weights.
+_MODEL_CACHE: dict[tuple[str, str, str, int, int], Any] = {}
+
+
+def clear_model_cache() -> None:
+    """Release all cached Whisper models (e.g. after the model or device changes)."""
+
+    _MODEL_CACHE.clear()
+
+
+class FasterWhisperEngine:
     """Transcription engine backed by the `faster-whisper` library."""
 
-    def __init__(self, model: str, device: str = "cpu") -> None:
+    def __init__(
+        self,
+        model: str,
+        device: str = "cpu",
+        compute_type: str = "auto",
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+    ) -> None:
         """Create a FasterWhisperEngine.
 
         Args:
             model: Whisper model size (e.g. "small") or a local model directory path.
             device: Inference device string (default: "cpu").
+            compute_type: CTranslate2 compute type, or "auto" to pick one per device.
+            cpu_threads: CPU threads used for inference (0: all available cores).
+            num_workers: Number of parallel decoders.
         """
 
         self._model_name = model
         self._device = device
+        self._compute_type = compute_type
+        self._cpu_threads = cpu_threads
+        self._num_workers = num_workers
         self._model = None
 
-    def transcribe(self, audio_path: Path, language: Optional[str] = None) -> str:
-        """Transcribe an audio file into plain text."""
+    def transcribe(
+        self, audio: Union[Path, np.ndarray], out: TextIO, language: Optional[str] = None
+    ) -> None:
+        """Transcribe an audio file, streaming plain text to `out`."""
 
         model = self._get_model()
-        segments, _info = model.transcribe(str(audio_path), language=language)
-        parts: list[str] = []
+        # `segments` is a lazy generator: each segment is decoded as we iterate.
+        source = str(audio) if isinstance(audio, Path) else audio
+        segments, _info = model.transcribe(source, language=language)
+
+        # Trailing whitespace is held back until more text follows, so the stream
+        # matches the stripped, newline-terminated transcript.
+        write = out.write
+        started = False
+        pending = ""
         for segment in segments:
             text = getattr(segment, "text", "")
-            if isinstance(text, str):
-                parts.append(text)
-        joined = "".join(parts).strip()
-        return f"{joined}\n" if joined else ""
+            if not isinstance(text, str):
+                continue
+            if not started:
+                text = text.lstrip()
+                if not text:
+                    continue
+                started = True
+
+            body = text.rstrip()
+            if body:
+                write(pending)
+                write(body)
+                pending = text[len(body):]
+            else:
+                pending += text
+
+        if started:
+            write("\n")
 
     def _get_model(self):
-        """Lazily construct the underlying faster-whisper model."""
+        """Lazily construct (or reuse a cached) underlying faster-whisper model."""
 
         if self._model is not None:
             return self._model
@@ -49,15 +103,28 @@ class FasterWhisperEngine(TranscriptionEngine):
                 "Missing dependency: faster-whisper. Install with `pip install -e .`."
             ) from exc
 
-        kwargs = {}
-        if self._device.strip().lower() == "cpu":
-            kwargs["compute_type"] = "int8"
+        compute_type = self._compute_type.strip().lower()
+        if compute_type == "auto":
+            compute_type = _AUTO_COMPUTE_TYPES.get(self._device.strip().lower(), "default")
+        cpu_threads = self._cpu_threads or os.cpu_count() or 0
 
-        try:
-            self._model = WhisperModel(self._model_name, device=self._device, **kwargs)
-        except Exception as exc:
-            raise RuntimeError(
-                f"Failed to load Whisper model '{self._model_name}'. If you're offline, "
-                "ensure the model is already cached or set --model to a local model path."
-            ) from exc
+        key = (self._model_name, self._device, compute_type, cpu_threads, self._num_workers)
+        model = _MODEL_CACHE.get(key)
+        if model is None:
+            try:
+                model = WhisperModel(
+                    self._model_name,
+                    device=self._device,
+                    compute_type=compute_type,
+                    cpu_threads=cpu_threads,
+                    num_workers=self._num_workers,
+                )
+            except Exception as exc:
+                raise RuntimeError(
+                    f"Failed to load Whisper model '{self._model_name}'. If you're offline, "
+                    "ensure the model is already cached or set --model to a local model path."
+                ) from exc
+            _MODEL_CACHE[key] = model
+
+        self._model = model
         return self._model
@@ -3,14 +3,26 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from pathlib import Path
+import os
+from pathlib import Path, PurePath
 import shutil
 import subprocess
-import tempfile
-from typing import Iterator
+from typing import TYPE_CHECKING, Iterator
 
+if TYPE_CHECKING:
+    import numpy as np
 
-SUPPORTED_EXTENSIONS = {".mp3", ".mp4"}
+
+SUPPORTED_EXTENSIONS: frozenset[str] = frozenset({".mp3", ".mp4"})
+
+# Whisper models expect 16kHz mono audio.
+SAMPLE_RATE = 16000
+
+# Decoder threads per FFmpeg run; MP3/AAC decoding gains little beyond a few cores.
+_DECODE_THREADS = str(min(4, os.cpu_count() or 1))
+
+# Cached result of the PATH lookup in find_ffmpeg.
+_FFMPEG_PATH: str | None = None
 
 
 class MediaError(RuntimeError):
@@ -29,29 +41,48 @@ class FfmpegFailedError(MediaError):
     """Raised when an FFmpeg command fails."""
 
 
-def is_supported_media(path: Path) -> bool:
+def is_supported_media(path: str | os.PathLike[str]) -> bool:
     """Return True if the file extension is supported."""
 
-    return path.suffix.lower() in SUPPORTED_EXTENSIONS
+    # Strings are checked without building a Path; splitext matches Path.suffix,
+    # including treating dotfiles such as ".mp3" as having no suffix.
+    suffix = path.suffix if isinstance(path, PurePath) else os.path.splitext(os.fspath(path))[1]
+    # Suffixes are usually lowercase already; only fold case when that misses.
+    return suffix in SUPPORTED_EXTENSIONS or suffix.lower() in SUPPORTED_EXTENSIONS
 
 
 def find_ffmpeg() -> str:
-    """Return the FFmpeg executable path (or raise if missing)."""
+    """Return the FFmpeg executable path (or raise if missing).
 
-    ffmpeg = shutil.which("ffmpeg")
-    if not ffmpeg:
+    A successful lookup is cached for the process; a miss is retried on the next call.
+    """
+
+    global _FFMPEG_PATH
+
+    if _FFMPEG_PATH is None:
+        _FFMPEG_PATH = shutil.which("ffmpeg")
+    if not _FFMPEG_PATH:
         raise FfmpegNotFoundError(
             "FFmpeg not found on PATH. Install FFmpeg and ensure `ffmpeg` is available."
         )
-    return ffmpeg
+    return _FFMPEG_PATH
+
 
+def invalidate_ffmpeg_cache() -> None:
+    """Forget the cached FFmpeg location so the next lookup walks PATH again."""
 
-def convert_to_wav(input_path: Path, output_wav: Path) -> None:
-    """Convert an MP3/MP4 file into a 16kHz mono WAV suitable for transcription.
+    global _FFMPEG_PATH
+    _FFMPEG_PATH = None
+
+
+def decode_to_array(input_path: Path) -> np.ndarray:
+    """Decode an MP3/MP4 file into 16kHz mono float32 PCM samples in memory.
+
+    FFmpeg writes raw `f32le` samples to a pipe, so no temporary WAV file is
+    written and read back.
 
     Args:
         input_path: Path to an .mp3 or .mp4 file.
-        output_wav: Output .wav path.
 
     Raises:
         UnsupportedMediaError: If input extension is not supported.
@@ -64,49 +95,54 @@ def convert_to_wav(input_path: Path, output_wav: Path) -> None:
             f"Unsupported input type: {input_path.suffix!r}. Supported: {sorted(SUPPORTED_EXTENSIONS)}"
         )
 
+    import numpy as np
+
     ffmpeg = find_ffmpeg()
     cmd = [
         ffmpeg,
         "-hide_banner",
+        "-threads",
+        _DECODE_THREADS,
+        "-filter_threads",
+        "2",
         "-nostdin",
         "-loglevel",
         "error",
-        "-y",
         "-i",
-        str(input_path),
+        os.fspath(input_path),
         "-vn",
         "-ac",
         "1",
         "-ar",
-        "16000",
+        str(SAMPLE_RATE),
+        "-f",
+        "f32le",
         "-c:a",
-        "pcm_s16le",
-        str(output_wav),
+        "pcm_f32le",
+        "-",
     ]
 
-    try:
-        subprocess.run(
-            cmd,
-            check=True,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-    except subprocess.CalledProcessError as exc:
-        details = (exc.stderr or "").strip()
-        hint = "FFmpeg failed to process the file."
-        extra = f"\n\nDetails:\n{details}" if details else ""
-        raise FfmpegFailedError(f"{hint}\n\nCommand: {' '.join(cmd)}{extra}") from exc
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise _ffmpeg_failed(cmd, result.stderr.decode("utf-8", errors="replace"))
+    return np.frombuffer(result.stdout, dtype=np.float32)
 
 
 @contextmanager
-def prepared_audio(input_path: Path) -> Iterator[Path]:
-    """Prepare audio for transcription and clean up temporary files.
+def prepared_audio(input_path: Path) -> Iterator[np.ndarray]:
+    """Prepare audio for transcription.
 
-    This converts MP3/MP4 to a temporary 16kHz mono WAV file and yields the WAV path.
+    This decodes MP3/MP4 into 16kHz mono float32 samples (see `decode_to_array`)
+    and yields the array; nothing is written to disk.
     """
 
-    with tempfile.TemporaryDirectory(prefix="transcriber-") as tmpdir:
-        wav_path = Path(tmpdir) / "audio.wav"
-        convert_to_wav(input_path, wav_path)
-        yield wav_path
+    yield decode_to_array(input_path)
+
+
+def _ffmpeg_failed(cmd: list[str], stderr: str) -> FfmpegFailedError:
+    """Internal helper to build an FfmpegFailedError with command and details."""
+
+    details = stderr.strip()
+    hint = "FFmpeg failed to process the file."
+    extra = f"\n\nDetails:\n{details}" if details else ""
+    return FfmpegFailedError(f"{hint}\n\nCommand: {' '.join(cmd)}{extra}")
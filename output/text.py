@@ -2,7 +2,29 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager, suppress
+import os
 from pathlib import Path
+import secrets
+from typing import IO, Any, Iterator, TextIO
+
+# Large write buffer for streamed transcripts: segments are small, so this keeps
+# the number of write syscalls low.
+_STREAM_BUFFER_SIZE = 1 << 20
+
+# Directories this process has already created (or found), so repeated writes
+# into the same folder skip the makedirs stat/mkdir calls.
+_ENSURED_DIRS: set[str] = set()
+
+
+# Exclusive creation for temporary files; binary on Windows so the C runtime never
+# translates newlines underneath Python's own text layer.
+_TMP_OPEN_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0) | getattr(os, "O_NOFOLLOW", 0)
+)
+
+# Attempts at finding an unused temporary name before giving up.
+_TMP_NAME_ATTEMPTS = 100
 
 
 def write_text_file(output_path: Path, text: str) -> None:
@@ -13,6 +35,69 @@ def write_text_file(output_path: Path, text: str) -> None:
         text: Transcript content.
     """
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(text, encoding="utf-8")
+    # Same path as streamed output, so both writers produce identical files
+    # (newline translation included) and share the atomic replace.
+    with open_text_output(output_path) as f:
+        f.write(text)
+
+
+@contextmanager
+def open_text_output(output_path: Path) -> Iterator[TextIO]:
+    """Open a transcript file for streamed writing.
+
+    Parent directories are created as needed. Text goes to a uniquely named
+    `.tmp` file in the same directory that replaces `output_path` only once the
+    body completes, so a crash never leaves a truncated transcript behind. If
+    the body raises, the temporary file is removed and any existing transcript
+    is left untouched.
+
+    Args:
+        output_path: Destination `.txt` path.
+    """
+
+    path = os.fspath(output_path)
+    f, tmp_path = _open_tmp(path, "w", encoding="utf-8", buffering=_STREAM_BUFFER_SIZE)
+    try:
+        with f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+
+def _open_tmp(path: str, mode: str, **kwargs: Any) -> tuple[IO[Any], str]:
+    """Internal helper to create and open a unique temporary file next to `path`.
+
+    The file is created exclusively, so concurrent writers of the same transcript
+    never share it and no existing file is clobbered. Its directory is created
+    once per process.
+
+    Returns:
+        The open file and its path.
+    """
 
+    directory = os.path.dirname(path) or os.curdir
+    if directory not in _ENSURED_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+    prefix = os.path.join(directory, f".{os.path.basename(path)}.")
+    for _ in range(_TMP_NAME_ATTEMPTS):
+        tmp_path = f"{prefix}{secrets.token_hex(4)}.tmp"
+        try:
+            # Mode 0o666 lets the kernel apply the umask, as for any plainly created file.
+            fd = os.open(tmp_path, _TMP_OPEN_FLAGS, 0o666)
+        except FileExistsError:
+            continue
+        except FileNotFoundError:
+            # The directory was removed after it was cached; create it again.
+            os.makedirs(directory, exist_ok=True)
+            fd = os.open(tmp_path, _TMP_OPEN_FLAGS, 0o666)
+        try:
+            return os.fdopen(fd, mode, **kwargs), tmp_path
+        except BaseException:
+            os.close(fd)
+            os.remove(tmp_path)
+            raise
+    raise FileExistsError(f"No unused temporary file name next to {path!r}.")
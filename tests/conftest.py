@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from app.config import get_config_path
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_path_cache() -> Iterator[None]:
+    # get_config_path is cached per process; tests that patch the platform or
+    # environment must not see (or leave behind) a stale path.
+    get_config_path.cache_clear()
+    yield
+    get_config_path.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def sample_srt_config(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # Read-only config shared by the whole session: asks for unsupported .srt output.
+    path = tmp_path_factory.mktemp("cfg") / "config.toml"
+    path.write_bytes(b'[output]\nextension = "srt"\n')
+    return path
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.cli import run_cli
+
+
+def test_run_rejects_missing_input(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        run_cli(["run", str(tmp_path / "missing.mp3")])
+    assert excinfo.value.code == 2
+    assert "does not exist" in capsys.readouterr().err
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 import platform
 
@@ -25,17 +26,15 @@ def test_load_config_defaults_when_missing(tmp_path: Path, monkeypatch: pytest.M
     assert load_config(config_path).engine.model == "small"
 
 
-def test_load_config_rejects_non_txt_extension(tmp_path: Path) -> None:
-    config_path = tmp_path / "config.toml"
-    config_path.write_text(
-        """
-[output]
-extension = "srt"
-""".lstrip(),
-        encoding="utf-8",
-    )
+def test_load_config_defaults_when_parent_is_a_file(tmp_path: Path) -> None:
+    parent = tmp_path / "transcriber"
+    parent.write_text("", encoding="utf-8")
+    assert load_config(parent / "config.toml").engine.model == "small"
+
+
+def test_load_config_rejects_non_txt_extension(sample_srt_config: Path) -> None:
     with pytest.raises(ValueError, match="Only plain text output"):
-        load_config(config_path)
+        load_config(sample_srt_config)
 
 
 def test_save_config_writes_file(tmp_path: Path) -> None:
@@ -48,3 +47,42 @@ def test_save_config_writes_file(tmp_path: Path) -> None:
     content = config_path.read_text(encoding="utf-8")
     assert "model = \"small\"" in content
     assert "device = \"cpu\"" in content
+
+
+def test_save_config_round_trips_windows_paths(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.toml"
+    model = r'C:\models\"faster" small'
+    save_config(AppConfig(engine=EngineConfig(model=model, device="cpu")), config_path)
+    assert load_config(config_path).engine.model == model
+
+
+def test_save_config_skips_unchanged_file(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.toml"
+    save_config(AppConfig(), config_path)
+    first = config_path.stat().st_mtime_ns
+
+    os.utime(config_path, ns=(first - 10**9, first - 10**9))
+    save_config(AppConfig(), config_path)
+    assert config_path.stat().st_mtime_ns == first - 10**9
+
+
+def test_load_config_reads_engine_tuning(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        """
+[engine]
+device = "cuda"
+cpu_threads = 4
+""".lstrip(),
+        encoding="utf-8",
+    )
+    engine = load_config(config_path).engine
+    assert (engine.model, engine.device, engine.compute_type) == ("small", "cuda", "auto")
+    assert (engine.cpu_threads, engine.num_workers) == (4, 1)
+
+
+def test_load_config_rejects_invalid_worker_count(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text("[engine]\nnum_workers = 0\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="num_workers"):
+        load_config(config_path)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+import sys
+import types
+
+import pytest
+
+from engine import faster_whisper
+from engine.faster_whisper import FasterWhisperEngine, clear_model_cache
+
+
+def test_models_are_shared_between_engines(monkeypatch: pytest.MonkeyPatch) -> None:
+    loads = []
+
+    class FakeWhisperModel:
+        def __init__(self, model: str, device: str, **kwargs: object) -> None:
+            loads.append((model, device, kwargs))
+
+    monkeypatch.setitem(sys.modules, "faster_whisper", types.SimpleNamespace(WhisperModel=FakeWhisperModel))
+    monkeypatch.setattr(faster_whisper, "_MODEL_CACHE", {})
+
+    first = FasterWhisperEngine(model="small", device="cpu")._get_model()
+    second = FasterWhisperEngine(model="small", device="cpu")._get_model()
+    assert first is second
+    assert len(loads) == 1
+
+    clear_model_cache()
+    FasterWhisperEngine(model="small", device="cpu")._get_model()
+    assert len(loads) == 2
+
+
+def test_transcribe_streams_stripped_text(monkeypatch: pytest.MonkeyPatch) -> None:
+    texts = ["  ", " Hello", " world.  ", "   ", " Bye. ", "  "]
+
+    class FakeModel:
+        def transcribe(self, audio: str, language: str | None = None):
+            return (types.SimpleNamespace(text=text) for text in texts), None
+
+    engine = FasterWhisperEngine(model="small")
+    monkeypatch.setattr(engine, "_get_model", lambda: FakeModel())
+
+    out = io.StringIO()
+    engine.transcribe(Path("audio.wav"), out)
+    assert out.getvalue() == "".join(texts).strip() + "\n"
+
+    texts = [" ", "  "]
+    out = io.StringIO()
+    engine.transcribe(Path("audio.wav"), out)
+    assert out.getvalue() == ""
@@ -1,8 +1,19 @@
 from __future__ import annotations
 
 from pathlib import Path
+import shutil
+import subprocess
 
-from media.audio import is_supported_media
+import pytest
+
+import media.audio
+from media.audio import (
+    FfmpegFailedError,
+    decode_to_array,
+    find_ffmpeg,
+    invalidate_ffmpeg_cache,
+    is_supported_media,
+)
 
 
 def test_is_supported_media() -> None:
@@ -10,3 +21,52 @@ def test_is_supported_media() -> None:
     assert is_supported_media(Path("a.mp4"))
     assert not is_supported_media(Path("a.wav"))
 
+
+def test_is_supported_media_ignores_case() -> None:
+    assert is_supported_media(Path("a.MP3"))
+    assert is_supported_media(Path("a.Mp4"))
+    assert not is_supported_media(Path("mp3"))
+
+
+def test_is_supported_media_accepts_strings() -> None:
+    assert is_supported_media("dir.d/a.mp3")
+    assert not is_supported_media("dir.mp3/a")
+    assert not is_supported_media(".mp3")
+
+
+def test_decode_to_array_reads_pcm_from_ffmpeg(monkeypatch: pytest.MonkeyPatch) -> None:
+    np = pytest.importorskip("numpy")
+    samples = np.array([0.0, 0.5, -0.25], dtype=np.float32)
+    monkeypatch.setattr(media.audio, "find_ffmpeg", lambda: "ffmpeg")
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 0, samples.tobytes(), b""),
+    )
+    assert decode_to_array(Path("a.mp3")).tolist() == samples.tolist()
+
+
+def test_decode_to_array_reports_ffmpeg_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(media.audio, "find_ffmpeg", lambda: "ffmpeg")
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 1, b"", b"bad input"),
+    )
+    with pytest.raises(FfmpegFailedError, match="bad input"):
+        decode_to_array(Path("a.mp3"))
+
+
+def test_find_ffmpeg_caches_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    lookups = []
+
+    def fake_which(name: str) -> str:
+        lookups.append(name)
+        return "/usr/bin/ffmpeg"
+
+    monkeypatch.setattr(shutil, "which", fake_which)
+    invalidate_ffmpeg_cache()
+    assert find_ffmpeg() == find_ffmpeg() == "/usr/bin/ffmpeg"
+    assert lookups == ["ffmpeg"]
+    invalidate_ffmpeg_cache()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+import sys
+import types
+from typing import TextIO
+
+import pytest
+
+from app import _menu_common as menu
+import engine
+import media.audio
+
+
+def test_safe_load_config_reuses_cached_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    config_path = tmp_path / "config.toml"
+    monkeypatch.setattr(menu, "get_config_path", lambda: config_path)
+    monkeypatch.setattr(menu, "load_config", lambda: menu.AppConfig())
+    monkeypatch.setattr(menu, "_CONFIG_CACHE", None)
+
+    first = menu._safe_load_config()
+    assert menu._safe_load_config() is first
+
+    config_path.write_text("[engine]\n", encoding="utf-8")
+    assert menu._safe_load_config() is not first
+
+
+def test_format_bytes_picks_unit() -> None:
+    assert menu._format_bytes(0) == "0.0 B"
+    assert menu._format_bytes(1023) == "1023.0 B"
+    assert menu._format_bytes(1536) == "1.5 KB"
+    assert menu._format_bytes(3 * 1024**3) == "3.0 GB"
+    assert menu._format_bytes(2048 * 1024**5) == "2048.0 PB"
+
+
+def test_run_transcription_writes_transcript(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    class FakeEngine:
+        def transcribe(self, audio: Path, out: TextIO, language: str | None = None) -> None:
+            out.write("hello\n")
+
+    @contextmanager
+    def fake_prepared_audio(input_path: Path):
+        yield input_path
+
+    monkeypatch.setattr(menu, "_safe_load_config", lambda: menu.AppConfig())
+    monkeypatch.setattr(engine, "create_engine", lambda config: FakeEngine())
+    monkeypatch.setattr(media.audio, "prepared_audio", fake_prepared_audio)
+
+    request = menu.TranscribeRequest(
+        input_path=tmp_path / "talk.mp3",
+        output_dir=tmp_path / "out",
+        model="small",
+        device="cpu",
+    )
+    output_path = menu._run_transcription(request)
+
+    assert output_path == tmp_path / "out" / "talk.txt"
+    assert output_path.read_text(encoding="utf-8") == "hello\n"
+
+
+def test_get_psutil_primes_cpu_sampler_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[object] = []
+    fake_psutil = types.ModuleType("psutil")
+    fake_psutil.cpu_percent = lambda interval=None: calls.append(interval) or 0.0  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "psutil", fake_psutil)
+    menu._get_psutil.cache_clear()
+    try:
+        assert menu._get_psutil() is fake_psutil
+        assert menu._get_psutil() is fake_psutil
+        assert calls == [None]
+    finally:
+        menu._get_psutil.cache_clear()
+
+
+def test_ffmpeg_path_shares_media_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    found: list[str | None] = [None]
+    monkeypatch.setattr(media.audio.shutil, "which", lambda name: found[0])
+    media.audio.invalidate_ffmpeg_cache()
+    assert menu._ffmpeg_path() is None
+
+    found[0] = "/usr/bin/ffmpeg"
+    assert menu._ffmpeg_path() == "/usr/bin/ffmpeg"
+    found[0] = None
+    assert menu._ffmpeg_path() == "/usr/bin/ffmpeg"
+    media.audio.invalidate_ffmpeg_cache()
+    assert menu._ffmpeg_path() is None
@@ -1,12 +1,74 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
-from output.text import write_text_file
+import pytest
+
+from output.text import open_text_output, write_text_file
 
 
 def test_write_text_file_creates_parent_dirs(tmp_path: Path) -> None:
     out = tmp_path / "nested" / "file.txt"
     write_text_file(out, "hello\n")
-    assert out.read_text(encoding="utf-8") == "hello\n"
+    assert out.read_bytes() == b"hello" + os.linesep.encode()
+
+
+def test_open_text_output_removes_partial_file(tmp_path: Path) -> None:
+    out = tmp_path / "nested" / "file.txt"
+    with pytest.raises(RuntimeError):
+        with open_text_output(out) as f:
+            f.write("partial")
+            raise RuntimeError("boom")
+    assert not out.exists()
+
+
+def test_open_text_output_keeps_existing_file_on_failure(tmp_path: Path) -> None:
+    out = tmp_path / "file.txt"
+    out.write_text("previous\n", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        with open_text_output(out) as f:
+            f.write("partial")
+            raise RuntimeError("boom")
+    assert out.read_text(encoding="utf-8") == "previous\n"
+    assert list(tmp_path.iterdir()) == [out]
+
+
+def test_write_text_file_recreates_removed_dir(tmp_path: Path) -> None:
+    out = tmp_path / "nested" / "file.txt"
+    write_text_file(out, "first\n")
+    out.unlink()
+    out.parent.rmdir()
+    write_text_file(out, "second\n")
+    assert out.read_text(encoding="utf-8") == "second\n"
+
+
+def test_open_text_output_leaves_unrelated_tmp_file_alone(tmp_path: Path) -> None:
+    out = tmp_path / "file.txt"
+    unrelated = tmp_path / "file.txt.tmp"
+    unrelated.write_bytes(b"keep me")
+    with pytest.raises(RuntimeError):
+        with open_text_output(out) as f:
+            f.write("partial")
+            raise RuntimeError("boom")
+    write_text_file(out, "done\n")
+    assert unrelated.read_bytes() == b"keep me"
+    assert sorted(tmp_path.iterdir()) == [out, unrelated]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_write_text_file_uses_default_permissions(tmp_path: Path) -> None:
+    out = tmp_path / "file.txt"
+    plain = tmp_path / "plain.txt"
+    plain.write_text("hello\n", encoding="utf-8")
+    write_text_file(out, "hello\n")
+    assert out.stat().st_mode & 0o777 == plain.stat().st_mode & 0o777
+
 
+def test_concurrent_writers_use_separate_temp_files(tmp_path: Path) -> None:
+    out = tmp_path / "file.txt"
+    with open_text_output(out) as first, open_text_output(out) as second:
+        first.write("first\n")
+        second.write("second\n")
+    assert out.read_text(encoding="utf-8") == "first\n"
+    assert list(tmp_path.iterdir()) == [out]
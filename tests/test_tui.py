@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+
+import pytest
+
+pytest.importorskip("textual")
+
+from rich.text import Text
+from textual.widgets import Button, RichLog
+
+from app import tui
+
+
+def test_run_tests_is_blocked_while_a_run_is_in_progress(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = threading.Event()
+    calls: list[int] = []
+
+    def fake_run_tests(on_line=None):
+        calls.append(1)
+        release.wait(5)
+        on_line("1 passed")
+        return 0, ""
+
+    monkeypatch.setattr(tui, "run_tests", fake_run_tests)
+
+    async def scenario() -> list[str]:
+        app = tui.MenuApp()
+        async with app.run_test() as pilot:
+            app._show_view("tests")
+            await pilot.pause()
+            view = app.query_one("#view-tests", tui.TestsView)
+            button = view.query_one("#run", Button)
+
+            await pilot.click("#view-tests #run")
+            await pilot.pause()
+            assert button.disabled
+            await pilot.click("#view-tests #run")
+
+            release.set()
+            for _ in range(50):
+                await pilot.pause(0.05)
+                if not button.disabled:
+                    break
+            assert not button.disabled
+            return [str(line.text) for line in view.query_one("#output", RichLog).lines]
+
+    lines = asyncio.run(scenario())
+    assert calls == [1]
+    assert lines.count("Tests passed.") == 1
+
+
+def test_line_batcher_holds_lines_until_interval_or_flush() -> None:
+    batches: list[str] = []
+    batcher = tui._LineBatcher(batches.append, interval=60.0)
+    batcher.add("line1")
+    batcher.add("line2")
+    assert batches == []
+    batcher.flush()
+    assert batches == ["line1\nline2"]
+    batcher.flush()
+    assert batches == ["line1\nline2"]
+
+
+def test_line_batcher_flushes_from_add_once_interval_passed() -> None:
+    batches: list[str] = []
+    batcher = tui._LineBatcher(batches.append, interval=0.0)
+    batcher.add("line1")
+    batcher.add("line2")
+    assert batches == ["line1", "line2"]
+
+
+def test_streamed_output_is_shown_while_tests_are_quiet(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = threading.Event()
+
+    def fake_run_tests(on_line=None):
+        on_line("collected 2 items")
+        release.wait(5)
+        return 0, ""
+
+    monkeypatch.setattr(tui, "run_tests", fake_run_tests)
+
+    async def scenario() -> list[str]:
+        app = tui.MenuApp()
+        async with app.run_test() as pilot:
+            app._show_view("tests")
+            await pilot.pause()
+            view = app.query_one("#view-tests", tui.TestsView)
+            await pilot.click("#view-tests #run")
+            await pilot.pause(0.5)
+            lines = [str(line.text) for line in view.query_one("#output", RichLog).lines]
+            release.set()
+            await pilot.pause(0.3)
+            return lines
+
+    assert "collected 2 items" in asyncio.run(scenario())
+
+
+def test_opening_the_menu_does_not_load_media_code(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delitem(sys.modules, "media.audio", raising=False)
+
+    async def scenario() -> bool:
+        app = tui.MenuApp()
+        async with app.run_test() as pilot:
+            await pilot.pause(0.3)
+            return "media.audio" in sys.modules
+
+    assert not asyncio.run(scenario())
+
+
+def test_tests_finished_without_a_run_is_shown() -> None:
+    async def scenario() -> list[str]:
+        app = tui.MenuApp()
+        async with app.run_test() as pilot:
+            app._show_view("tests")
+            await pilot.pause()
+            view = app.query_one("#view-tests", tui.TestsView)
+            view.post_message(tui.TestsFinished(Text("Tests passed.")))
+            await pilot.pause(0.1)
+            return [str(line.text) for line in view.query_one("#output", RichLog).lines]
+
+    assert asyncio.run(scenario()) == ["Tests passed."]